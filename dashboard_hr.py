@@ -1,51 +1,167 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
 
 # --- 데이터 로딩 및 캐싱 ---
+# CSV 컬럼 타입 (타입 추론을 생략하고, 카디널리티가 낮은 문자열은 category로 바로 읽음)
+HR_DTYPES = {
+    'Department': 'category',
+    'JobRole': 'category',
+    'Gender': 'category',
+    'MaritalStatus': 'category',
+    'OverTime': 'category',
+    'BusinessTravel': 'category',
+    'Attrition': 'category',
+    'EducationField': 'category',
+    'Age': 'int16',
+    'YearsAtCompany': 'int16',
+    'MonthlyIncome': 'int32',
+    'JobSatisfaction': 'int8',
+    'JobLevel': 'int8',
+    'WorkLifeBalance': 'int8',
+}
+
+def bin_right_open(values, bins, labels):
+    """pd.cut(..., right=False)와 같은 [a, b) 구간화를 np.searchsorted로 수행합니다. (구간 밖 값은 NaN)"""
+    codes = np.searchsorted(bins, values.to_numpy(), side='right') - 1
+    codes[codes >= len(labels)] = -1
+    return pd.Categorical.from_codes(codes.astype(np.int8), categories=labels, ordered=True)
+
 @st.cache_data
 def load_data(file_path):
-    """지정된 경로에서 HR 데이터셋을 로드합니다."""
+    """지정된 경로에서 HR 데이터셋을 로드하고, 사이드바 필터 옵션을 함께 반환합니다."""
     try:
-        return pd.read_csv(file_path)
+        df = pd.read_csv(file_path, dtype=HR_DTYPES)
     except FileNotFoundError:
         st.error(f"데이터 파일을 찾을 수 없습니다: {file_path}")
-        return None
-
-df = load_data('HR-employee-attrition/HR-Employee-Attrition.csv')
+        return None, None
+
+    # 'Attrition'을 숫자로 변환 (Yes=1, No=0) - 캐시 안에서 한 번만 계산
+    df['Attrition_numeric'] = np.equal(df['Attrition'].to_numpy(), 'Yes').astype(np.int8)
+
+    # 연령대 / 근속 년수 그룹 (구간이 고정이므로 전체 데이터에 한 번만 적용)
+    bins = [18, 30, 40, 50, 60]
+    labels = ['18-29', '30-39', '40-49', '50-59']
+    df['AgeGroup'] = bin_right_open(df['Age'], bins, labels)
+    bins_years = [0, 3, 6, 11, df['YearsAtCompany'].max() + 1]
+    labels_years = ['0-2년', '3-5년', '6-10년', '11년 이상']
+    df['YearsGroup'] = bin_right_open(df['YearsAtCompany'], bins_years, labels_years)
+
+    # 위젯과 무관한 필터 옵션은 로딩 시 한 번만 계산
+    filter_options = {
+        'departments': df['Department'].cat.categories.tolist(),
+        'job_roles': df['JobRole'].cat.categories.tolist(),
+        'genders': df['Gender'].cat.categories.tolist(),
+        'age_min': int(df['Age'].min()),
+        'age_max': int(df['Age'].max()),
+    }
+    return df, filter_options
+
+def group_attrition_rate(data, column):
+    """column 그룹별 이직률(%)을 계산합니다. (그룹 코드에 대한 bincount 한 번으로 합계/건수 집계)"""
+    codes, groups = pd.factorize(data[column], sort=True)
+    valid = codes >= 0  # 구간 밖(NaN) 값은 groupby와 동일하게 제외
+    counts = np.bincount(codes[valid], minlength=len(groups))
+    sums = np.bincount(codes[valid], weights=data['Attrition_numeric'].to_numpy()[valid], minlength=len(groups))
+    return pd.DataFrame({column: groups, 'Attrition_numeric': sums / counts * 100})
+
+def format_percent(values):
+    """이직률 값을 '12.34%' 형식의 막대 라벨 배열로 변환합니다."""
+    return np.char.add(np.char.mod('%.2f', values.to_numpy()), '%')
+
+@st.cache_resource(max_entries=64)
+def build_rate_bar(rows, column, title, show_text=False):
+    """(그룹, 이직률) 행 튜플로 이직률 막대 차트를 생성합니다. 집계 결과가 같으면 캐시된 Figure를 재사용합니다."""
+    data = pd.DataFrame(list(rows), columns=[column, 'Attrition_numeric'])
+    return px.bar(
+        data,
+        x=column,
+        y='Attrition_numeric',
+        title=title,
+        text=format_percent(data['Attrition_numeric']) if show_text else None
+    )
+
+@st.cache_resource(max_entries=64)
+def build_attrition_pie(rows):
+    """(이직 여부, 인원) 행 튜플로 이직자/잔류자 비율 파이 차트를 생성합니다."""
+    data = pd.DataFrame(list(rows), columns=['Attrition', 'count'])
+    return px.pie(data, values='count', names='Attrition', title='이직자/잔류자 비율', hole=0.3)
+
+def rate_bar(rate_df, column, title, show_text=False):
+    """group_attrition_rate 결과를 행 튜플(캐시 키)로 바꿔 build_rate_bar를 호출합니다."""
+    rows = tuple(rate_df[[column, 'Attrition_numeric']].itertuples(index=False, name=None))
+    return build_rate_bar(rows, column, title, show_text)
+
+def income_box(data, title):
+    """이직 여부별 월소득 박스 플롯을 생성합니다. (원본 행 대신 그룹별 요약 통계만 전달)"""
+    stats = data.groupby('Attrition', observed=True)['MonthlyIncome'].describe(percentiles=[.25, .5, .75])
+    fig = go.Figure(go.Box(
+        x=stats.index.astype(str).tolist(),
+        lowerfence=stats['min'].tolist(),
+        q1=stats['25%'].tolist(),
+        median=stats['50%'].tolist(),
+        q3=stats['75%'].tolist(),
+        upperfence=stats['max'].tolist()
+    ))
+    fig.update_layout(title=title, xaxis_title='Attrition', yaxis_title='MonthlyIncome')
+    return fig
+
+@st.fragment
+def show_conclusions():
+    """분석 결론 및 제언 (위젯과 무관한 정적 콘텐츠)"""
+    st.subheader("분석 결론 및 제언")
+    st.markdown("""
+    - **결론:**
+        - **공통 요인:** 초과 근무, 낮은 워라밸, 낮은 월소득은 전반적인 이직률을 높이는 주요 원인입니다.
+        - **영업 직군:** 특히 영업 직군에서는 **잦은 출장**과 **초과근무**가 이직의 결정적 요인으로 작용합니다. 이 두 가지 문제가 해결되지 않으면 영업팀의 높은 이직률은 계속될 가능성이 높습니다.
+        - **저연차 직원 (3년차 이하):** 이 그룹에서는 **낮은 직무 만족도**와 **낮은 월소득**이 핵심 이직 사유입니다. 경력 초기에 충분한 동기부여와 보상이 제공되지 않아 이탈이 가속화되는 것으로 보입니다.
+
+    - **제언:**
+      1.  **[Target: 저연차, 영업직] 워라밸 및 보상체계 개선:**
+          - **초과근무 관리:** 불필요한 초과근무를 줄이고, 시행 시 명확한 보상 체계(대체 휴가, 수당 등)를 제공해야 합니다. 특히 초과근무가 잦은 영업 직군의 워크로드를 우선적으로 점검해야 합니다.
+          - **경쟁력 있는 초기 보상:** 저연차 직원의 초임 연봉을 업계 평균 이상으로 재설정하고, 성과에 따른 인상률을 명확히 제시하여 소득 불만으로 인한 이탈을 방지해야 합니다.
+
+      2.  **[Target: 영업직] 출장 정책 현실화:**
+          - 잦은 출장이 필수적인 영업 직무에 대해 **재택근무일 보장**, **출장 수당 현실화**, **숙소 및 교통 지원 강화** 등 실질적인 복지를 강화하여 만족도를 높여야 합니다.
+
+      3.  **[Target: 저연차] 경력 초기 직원 온보딩 강화:**
+          - **직무 만족도 향상:** 신입 및 저연차 직원을 대상으로 한 체계적인 멘토링을 의무화하고, 정기적인 1:1 면담을 통해 고충을 파악하고 해결해야 합니다.
+          - **성장 경로 제시:** 명확한 커리어 패스와 성장 목표를 제시하여, 경력 초기 직원들이 회사 내에서 자신의 미래를 긍정적으로 그릴 수 있도록 지원해야 합니다.
+    """)
+
+df, filter_options = load_data('HR-employee-attrition/HR-Employee-Attrition.csv')
 
 if df is None:
     st.stop()
 
-# 'Attrition'을 숫자로 변환 (Yes=1, No=0)
-df['Attrition_numeric'] = df['Attrition'].apply(lambda x: 1 if x == 'Yes' else 0)
-
 # --- 사이드바 ---
 st.sidebar.title("HR 이직률 감소를 위한 분석 대시보드")
 
 # 부서 선택
 selected_departments = st.sidebar.multiselect(
     '부서 선택 (Department)',
-    options=df['Department'].unique(),
-    default=df['Department'].unique()
+    options=filter_options['departments'],
+    default=filter_options['departments']
 )
 
 # 직무 선택
 selected_job_roles = st.sidebar.multiselect(
     '직무 선택 (JobRole)',
-    options=df['JobRole'].unique(),
-    default=df['JobRole'].unique()
+    options=filter_options['job_roles'],
+    default=filter_options['job_roles']
 )
 
 # 성별 선택
 selected_gender = st.sidebar.radio(
     '성별 선택 (Gender)',
-    options=['All'] + list(df['Gender'].unique()),
+    options=['All'] + filter_options['genders'],
     index=0
 )
 
 # 연령대 선택
-min_age, max_age = int(df['Age'].min()), int(df['Age'].max())
+min_age, max_age = filter_options['age_min'], filter_options['age_max']
 selected_age_range = st.sidebar.slider(
     '연령대 선택 (Age Range)',
     min_value=min_age,
@@ -55,14 +171,51 @@ selected_age_range = st.sidebar.slider(
 
 
 # --- 데이터 필터링 ---
-filtered_df = df[
-    (df['Department'].isin(selected_departments)) &
-    (df['JobRole'].isin(selected_job_roles)) &
-    (df['Age'] >= selected_age_range[0]) &
-    (df['Age'] <= selected_age_range[1])
-]
-if selected_gender != 'All':
-    filtered_df = filtered_df[filtered_df['Gender'] == selected_gender]
+def is_default_filter(departments, job_roles, gender, age_min, age_max):
+    """모든 항목이 선택된 기본 필터 상태인지 확인합니다."""
+    return (set(departments) == set(filter_options['departments']) and
+            set(job_roles) == set(filter_options['job_roles']) and
+            gender == 'All' and
+            (age_min, age_max) == (filter_options['age_min'], filter_options['age_max']))
+
+@st.cache_data(max_entries=64)
+def filter_data(departments, job_roles, gender, age_min, age_max):
+    """사이드바 필터 값으로 데이터를 필터링합니다. (기본 필터가 아닐 때만 호출, 같은 필터 조합은 캐시에서 반환)"""
+    # category 코드(정수) 배열에서 직접 마스크를 만들고, 하나의 bool 배열에 누적하여 임시 배열을 줄임
+    dept_cat = df['Department'].cat
+    role_cat = df['JobRole'].cat
+    gender_cat = df['Gender'].cat
+    age = df['Age'].to_numpy()
+
+    mask = np.isin(dept_cat.codes.to_numpy(), dept_cat.categories.get_indexer(departments))
+    mask &= np.isin(role_cat.codes.to_numpy(), role_cat.categories.get_indexer(job_roles))
+    mask &= age >= age_min
+    mask &= age <= age_max
+    if gender != 'All':
+        mask &= gender_cat.codes.to_numpy() == gender_cat.categories.get_loc(gender)
+    return df.loc[mask]
+
+def get_filtered_df(departments, job_roles, gender, age_min, age_max):
+    """기본 필터 상태면 원본 df를 복사 없이 그대로, 아니면 filter_data의 캐시 결과를 반환합니다."""
+    # st.cache_data는 반환값의 복사본을 돌려주므로, 기본 상태 판단은 캐시 함수 밖에서 수행
+    if is_default_filter(departments, job_roles, gender, age_min, age_max):
+        return df
+    return filter_data(departments, job_roles, gender, age_min, age_max)
+
+@st.cache_data(max_entries=64)
+def sunburst_counts(departments, job_roles, gender, age_min, age_max):
+    """성별/결혼 상태/이직 여부 조합별 직원 수를 미리 집계합니다. (sunburst 차트용)"""
+    data = get_filtered_df(departments, job_roles, gender, age_min, age_max)
+    return data.groupby(['Gender', 'MaritalStatus', 'Attrition'], observed=True).size().reset_index(name='count')
+
+filter_key = (
+    tuple(selected_departments),
+    tuple(selected_job_roles),
+    selected_gender,
+    selected_age_range[0],
+    selected_age_range[1]
+)
+filtered_df = get_filtered_df(*filter_key)
 
 
 # --- 메인 화면 ---
@@ -77,10 +230,11 @@ else:
         st.header("대시보드 요약 (Dashboard Summary)")
 
         # 주요 지표
-        total_employees = filtered_df.shape[0]
-        attrition_rate = filtered_df['Attrition_numeric'].mean() * 100
-        avg_satisfaction = filtered_df['JobSatisfaction'].mean()
-        avg_income = filtered_df['MonthlyIncome'].mean()
+        # 세 컬럼의 평균을 한 번의 연산으로 계산
+        metric_values = filtered_df[['Attrition_numeric', 'JobSatisfaction', 'MonthlyIncome']].to_numpy(dtype=np.float64)
+        total_employees = len(metric_values)
+        attrition_mean, avg_satisfaction, avg_income = metric_values.mean(axis=0)
+        attrition_rate = attrition_mean * 100
 
         col1, col2, col3, col4 = st.columns(4)
         col1.metric("총 직원 수", f"{total_employees:,}")
@@ -90,21 +244,18 @@ else:
 
         # 전체 이직 현황
         st.subheader("전체 이직 현황")
-        attrition_counts = filtered_df['Attrition'].value_counts().reset_index()
-        fig_pie = px.pie(attrition_counts, values='count', names='Attrition', title='이직자/잔류자 비율', hole=0.3)
+        attrition_cat = filtered_df['Attrition'].cat
+        attrition_counts = pd.DataFrame({
+            'Attrition': attrition_cat.categories,
+            'count': np.bincount(attrition_cat.codes.to_numpy(), minlength=len(attrition_cat.categories))
+        })
+        fig_pie = build_attrition_pie(tuple(attrition_counts.itertuples(index=False, name=None)))
         st.plotly_chart(fig_pie)
 
         # 부서별 이직률
         st.subheader("부서별 이직률")
-        dept_attrition_rate = filtered_df.groupby('Department')['Attrition_numeric'].mean().reset_index()
-        dept_attrition_rate['Attrition_numeric'] *= 100
-        fig_dept_rate = px.bar(
-            dept_attrition_rate.sort_values(by='Attrition_numeric', ascending=False),
-            x='Department',
-            y='Attrition_numeric',
-            text=dept_attrition_rate['Attrition_numeric'].apply(lambda x: f'{x:.2f}%'),
-            title='부서별 이직률 (%)'
-        )
+        dept_attrition_rate = group_attrition_rate(filtered_df, 'Department').sort_values(by='Attrition_numeric', ascending=False)
+        fig_dept_rate = rate_bar(dept_attrition_rate, 'Department', '부서별 이직률 (%)', show_text=True)
         st.plotly_chart(fig_dept_rate)
 
 
@@ -113,26 +264,24 @@ else:
 
         # 인구통계별 이직률
         st.subheader("인구통계별 이직률")
-        bins = [18, 30, 40, 50, 60]
-        labels = ['18-29', '30-39', '40-49', '50-59']
-        filtered_df['AgeGroup'] = pd.cut(filtered_df['Age'], bins=bins, labels=labels, right=False)
-        age_attrition_rate = filtered_df.groupby('AgeGroup', observed=True)['Attrition_numeric'].mean().reset_index()
-        age_attrition_rate['Attrition_numeric'] *= 100
-        fig_age_rate = px.bar(age_attrition_rate, x='AgeGroup', y='Attrition_numeric', title='연령대별 이직률 (%)')
+        age_attrition_rate = group_attrition_rate(filtered_df, 'AgeGroup')
+        fig_age_rate = rate_bar(age_attrition_rate, 'AgeGroup', '연령대별 이직률 (%)')
         st.plotly_chart(fig_age_rate)
         
         # 성별 및 결혼 상태별 이직률
         fig_sunburst = px.sunburst(
-            filtered_df,
+            sunburst_counts(*filter_key),
             path=['Gender', 'MaritalStatus', 'Attrition'],
+            values='count',
             title='성별 및 결혼 상태에 따른 이직 현황'
         )
         st.plotly_chart(fig_sunburst)
 
         # 직무 관련 특성별 이직률
         st.subheader("직무 관련 특성별 이직률")
-        job_level_satisfaction = filtered_df.groupby(['JobLevel', 'JobSatisfaction'])['Attrition_numeric'].mean().reset_index()
-        job_level_satisfaction['size'] = filtered_df.groupby(['JobLevel', 'JobSatisfaction']).size().values
+        job_level_satisfaction = filtered_df.groupby(['JobLevel', 'JobSatisfaction'], observed=True)['Attrition_numeric'].agg(
+            ['mean', 'size']
+        ).reset_index().rename(columns={'mean': 'Attrition_numeric'})
         fig_treemap = px.treemap(
             job_level_satisfaction,
             path=[px.Constant("전체"), 'JobLevel', 'JobSatisfaction'],
@@ -145,12 +294,8 @@ else:
         st.plotly_chart(fig_treemap)
 
         # 근속 년수 그룹별 이직률
-        bins_years = [0, 3, 6, 11, df['YearsAtCompany'].max() + 1]
-        labels_years = ['0-2년', '3-5년', '6-10년', '11년 이상']
-        filtered_df['YearsGroup'] = pd.cut(filtered_df['YearsAtCompany'], bins=bins_years, labels=labels_years, right=False)
-        years_attrition_rate = filtered_df.groupby('YearsGroup', observed=True)['Attrition_numeric'].mean().reset_index()
-        years_attrition_rate['Attrition_numeric'] *= 100
-        fig_years_rate = px.bar(years_attrition_rate, x='YearsGroup', y='Attrition_numeric', title='근속 년수 그룹별 이직률 (%)')
+        years_attrition_rate = group_attrition_rate(filtered_df, 'YearsGroup')
+        fig_years_rate = rate_bar(years_attrition_rate, 'YearsGroup', '근속 년수 그룹별 이직률 (%)')
         st.plotly_chart(fig_years_rate)
 
     with tab3:
@@ -160,50 +305,59 @@ else:
         # 주요 이직 유발 요인 시각화
         st.subheader("주요 이직 유발 요인")
         key_factors = ['OverTime', 'BusinessTravel', 'WorkLifeBalance']
-        for factor in key_factors:
-            factor_attrition_rate = filtered_df.groupby(factor)['Attrition_numeric'].mean().reset_index()
-            factor_attrition_rate['Attrition_numeric'] *= 100
-            
-            fig = px.bar(
-                factor_attrition_rate,
-                x=factor,
-                y='Attrition_numeric',
-                title=f'{factor}에 따른 이직률 (%)',
-                text=factor_attrition_rate['Attrition_numeric'].apply(lambda x: f'{x:.2f}%')
-            )
-            st.plotly_chart(fig)
-            
-            if factor == 'OverTime':
-                ot_yes_rate = factor_attrition_rate[factor_attrition_rate['OverTime'] == 'Yes']['Attrition_numeric'].iloc[0]
-                ot_no_rate = factor_attrition_rate[factor_attrition_rate['OverTime'] == 'No']['Attrition_numeric'].iloc[0]
-                if ot_no_rate > 0:
-                    st.caption(f"초과근무 'Yes' 그룹의 이직률이 'No' 그룹보다 약 {ot_yes_rate/ot_no_rate:.1f}배 높습니다.")
+        factor_rates = {factor: group_attrition_rate(filtered_df, factor) for factor in key_factors}
+
+        # 세 요인을 하나의 facet 차트로 그려 Figure 생성/렌더링을 한 번으로 줄임
+        factor_long = pd.concat(
+            [
+                rate.rename(columns={factor: 'value'}).astype({'value': str}).assign(factor=factor)
+                for factor, rate in factor_rates.items()
+            ],
+            ignore_index=True
+        )
+        fig_factors = px.bar(
+            factor_long,
+            x='value',
+            y='Attrition_numeric',
+            facet_col='factor',
+            facet_col_wrap=3,
+            text=format_percent(factor_long['Attrition_numeric']),
+            title='주요 요인별 이직률 (%)'
+        )
+        fig_factors.update_xaxes(matches=None, title_text='')
+        fig_factors.for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+        st.plotly_chart(fig_factors)
+
+        # 필터 결과에 OverTime 값이 한쪽만 있을 수 있으므로 'Yes'/'No'가 모두 있을 때만 비율 표시
+        ot_rate = factor_rates['OverTime']
+        ot_rates = dict(zip(ot_rate['OverTime'].astype(str), ot_rate['Attrition_numeric']))
+        ot_yes_rate, ot_no_rate = ot_rates.get('Yes'), ot_rates.get('No')
+        if ot_yes_rate is not None and ot_no_rate is not None and ot_no_rate > 0:
+            st.caption(f"초과근무 'Yes' 그룹의 이직률이 'No' 그룹보다 약 {ot_yes_rate/ot_no_rate:.1f}배 높습니다.")
 
         # 소득과 이직의 관계
         st.subheader("소득과 이직의 관계")
-        fig_income_box = px.box(filtered_df, x='Attrition', y='MonthlyIncome', title='이직 여부에 따른 월소득 분포')
+        fig_income_box = income_box(filtered_df, '이직 여부에 따른 월소득 분포')
         st.plotly_chart(fig_income_box)
         st.caption("이직 그룹(Yes)의 월소득 중앙값이 잔류 그룹(No)보다 낮은 경향을 보입니다.")
 
         # --- 영업 직군 심층 분석 ---
         st.subheader("❓ 영업직은 왜 많이 퇴사할까?")
-        sales_df = filtered_df[filtered_df['JobRole'].isin(['Sales Executive', 'Sales Representative'])]
+        role_cat = filtered_df['JobRole'].cat
+        sales_codes = role_cat.categories.get_indexer(['Sales Executive', 'Sales Representative'])
+        sales_df = filtered_df[np.isin(role_cat.codes.to_numpy(), sales_codes)]
         if not sales_df.empty:
             st.markdown("영업 직군(Sales Executive, Sales Representative)의 주요 이직 요인을 심층 분석합니다.")
             
             # 영업 직군의 초과근무별 이직률
-            sales_overtime_attrition = sales_df.groupby('OverTime')['Attrition_numeric'].mean().reset_index()
-            sales_overtime_attrition['Attrition_numeric'] *= 100
-            fig_sales_ot = px.bar(sales_overtime_attrition, x='OverTime', y='Attrition_numeric', title='영업 직군: 초과근무에 따른 이직률',
-                                  text=sales_overtime_attrition['Attrition_numeric'].apply(lambda x: f'{x:.2f}%'))
+            sales_overtime_attrition = group_attrition_rate(sales_df, 'OverTime')
+            fig_sales_ot = rate_bar(sales_overtime_attrition, 'OverTime', '영업 직군: 초과근무에 따른 이직률', show_text=True)
             st.plotly_chart(fig_sales_ot)
             st.caption("영업 직군 내에서도 초과근무를 하는 경우 이직률이 급격히 증가하는 것을 확인할 수 있습니다.")
 
             # 영업 직군의 출장 빈도별 이직률
-            sales_travel_attrition = sales_df.groupby('BusinessTravel')['Attrition_numeric'].mean().reset_index()
-            sales_travel_attrition['Attrition_numeric'] *= 100
-            fig_sales_travel = px.bar(sales_travel_attrition, x='BusinessTravel', y='Attrition_numeric', title='영업 직군: 출장 빈도에 따른 이직률',
-                                      text=sales_travel_attrition['Attrition_numeric'].apply(lambda x: f'{x:.2f}%'))
+            sales_travel_attrition = group_attrition_rate(sales_df, 'BusinessTravel')
+            fig_sales_travel = rate_bar(sales_travel_attrition, 'BusinessTravel', '영업 직군: 출장 빈도에 따른 이직률', show_text=True)
             st.plotly_chart(fig_sales_travel)
             st.caption("출장이 잦을수록(Travel_Frequently) 이직률이 높아지는 경향을 보이며, 특히 영업 직군에서 두드러집니다.")
 
@@ -212,43 +366,23 @@ else:
 
         # --- 저연차 직원 심층 분석 ---
         st.subheader("❓ 입사 3년차 이하 직원은 왜 많이 퇴사할까?")
-        early_career_df = filtered_df[filtered_df['YearsAtCompany'] <= 3]
+        early_career_df = filtered_df[filtered_df['YearsAtCompany'].to_numpy() <= 3]
         if not early_career_df.empty:
             st.markdown("입사 3년차 이하 저연차 직원의 주요 이직 요인을 심층 분석합니다.")
 
             # 저연차 직원의 직무 만족도별 이직률
-            early_career_satisfaction = early_career_df.groupby('JobSatisfaction')['Attrition_numeric'].mean().reset_index()
-            early_career_satisfaction['Attrition_numeric'] *= 100
-            fig_early_satis = px.bar(early_career_satisfaction, x='JobSatisfaction', y='Attrition_numeric', title='저연차 직원: 직무 만족도에 따른 이직률',
-                                     text=early_career_satisfaction['Attrition_numeric'].apply(lambda x: f'{x:.2f}%'))
+            early_career_satisfaction = group_attrition_rate(early_career_df, 'JobSatisfaction')
+            fig_early_satis = rate_bar(early_career_satisfaction, 'JobSatisfaction', '저연차 직원: 직무 만족도에 따른 이직률', show_text=True)
             st.plotly_chart(fig_early_satis)
             st.caption("저연차 직원 그룹에서는 직무 만족도가 낮을수록(1, 2) 이직률이 매우 높은 것을 알 수 있습니다. 이들의 조기 안착을 위한 노력이 필요합니다.")
 
             # 저연차 직원의 이직 여부별 월소득
-            fig_early_income = px.box(early_career_df, x='Attrition', y='MonthlyIncome', title='저연차 직원: 이직 여부에 따른 월소득 분포')
+            fig_early_income = income_box(early_career_df, '저연차 직원: 이직 여부에 따른 월소득 분포')
             st.plotly_chart(fig_early_income)
             st.caption("저연차 그룹에서도 이직하는 직원들의 월소득이 잔류하는 직원들보다 낮은 경향이 뚜렷하게 나타납니다. 특히 소득 하위 25% 그룹의 이탈이 두드러집니다.")
 
         else:
             st.warning("선택된 필터에 3년차 이하 직원 데이터가 없습니다.")
 
-        # 분석 결론 및 제언
-        st.subheader("분석 결론 및 제언")
-        st.markdown("""
-        - **결론:**
-            - **공통 요인:** 초과 근무, 낮은 워라밸, 낮은 월소득은 전반적인 이직률을 높이는 주요 원인입니다.
-            - **영업 직군:** 특히 영업 직군에서는 **잦은 출장**과 **초과근무**가 이직의 결정적 요인으로 작용합니다. 이 두 가지 문제가 해결되지 않으면 영업팀의 높은 이직률은 계속될 가능성이 높습니다.
-            - **저연차 직원 (3년차 이하):** 이 그룹에서는 **낮은 직무 만족도**와 **낮은 월소득**이 핵심 이직 사유입니다. 경력 초기에 충분한 동기부여와 보상이 제공되지 않아 이탈이 가속화되는 것으로 보입니다.
-
-        - **제언:**
-          1.  **[Target: 저연차, 영업직] 워라밸 및 보상체계 개선:**
-              - **초과근무 관리:** 불필요한 초과근무를 줄이고, 시행 시 명확한 보상 체계(대체 휴가, 수당 등)를 제공해야 합니다. 특히 초과근무가 잦은 영업 직군의 워크로드를 우선적으로 점검해야 합니다.
-              - **경쟁력 있는 초기 보상:** 저연차 직원의 초임 연봉을 업계 평균 이상으로 재설정하고, 성과에 따른 인상률을 명확히 제시하여 소득 불만으로 인한 이탈을 방지해야 합니다.
-
-          2.  **[Target: 영업직] 출장 정책 현실화:**
-              - 잦은 출장이 필수적인 영업 직무에 대해 **재택근무일 보장**, **출장 수당 현실화**, **숙소 및 교통 지원 강화** 등 실질적인 복지를 강화하여 만족도를 높여야 합니다.
-
-          3.  **[Target: 저연차] 경력 초기 직원 온보딩 강화:**
-              - **직무 만족도 향상:** 신입 및 저연차 직원을 대상으로 한 체계적인 멘토링을 의무화하고, 정기적인 1:1 면담을 통해 고충을 파악하고 해결해야 합니다.
-              - **성장 경로 제시:** 명확한 커리어 패스와 성장 목표를 제시하여, 경력 초기 직원들이 회사 내에서 자신의 미래를 긍정적으로 그릴 수 있도록 지원해야 합니다.
-        """)
\ No newline at end of file
+        # 분석 결론 및 제언 (정적 콘텐츠)
+        show_conclusions()
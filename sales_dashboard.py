@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import numpy as np
 
 # pandas SettingWithCopyWarning 경고 무시 설정 (Streamlit 환경에서 loc 사용 시 발생하는 경고)
@@ -8,51 +10,196 @@ pd.options.mode.chained_assignment = None
 
 # --- 1. 데이터 준비 및 보조 함수 ---
 
-@st.cache_data
+# 대시보드에서 실제로 사용하는 컬럼 (필터 결과 캐시/차트 입력의 데이터 양을 줄이기 위해 이 컬럼만 로드)
+USED_COLUMNS = [
+    'Attrition', 'Department', 'JobRole', 'Gender', 'Age', 'MaritalStatus',
+    'OverTime', 'BusinessTravel', 'EducationField', 'MonthlyIncome', 'JobLevel',
+    'JobSatisfaction', 'EnvironmentSatisfaction', 'RelationshipSatisfaction',
+    'WorkLifeBalance', 'PerformanceRating', 'YearsAtCompany',
+    'YearsSinceLastPromotion', 'DistanceFromHome'
+]
+
+# Sales팀 탭의 단일 요인 이직률 바 차트 (6. ~ 15.)
+SALES_FACTORS = [
+    'OverTime', 'BusinessTravel', 'JobSatisfaction', 'YearsAtCompany_Group',
+    'WorkLifeBalance', 'JobLevel', 'EducationField', 'RelationshipSatisfaction',
+    'PerformanceRating', 'MaritalStatus'
+]
+
+# 이 행 수 미만으로 필터링되면 차트(Figure)를 만들지 않고 요약 통계만 표시
+MIN_CHART_ROWS = 20
+
+def bin_right_open(values, bins, labels):
+    """pd.cut(..., right=False)와 같은 [a, b) 구간화를 np.searchsorted로 수행 (구간 밖 값은 NaN, dashboard_hr.py와 동일)"""
+    codes = np.searchsorted(bins, values.to_numpy(), side='right') - 1
+    codes[codes >= len(labels)] = -1
+    return pd.Categorical.from_codes(codes.astype(np.int8), categories=labels, ordered=True)
+
+@st.cache_resource
 def load_data(file_path):
-    """데이터를 로드하고 기본 전처리 수행"""
+    """데이터를 로드하고 기본 전처리 수행 (프로세스 전체에서 공유하는 읽기 전용 DataFrame 반환)"""
     # 파일 경로 수정 (사용자 환경에 맞게)
     try:
-        df = pd.read_csv(file_path)
+        df = pd.read_csv(file_path, engine='pyarrow', usecols=USED_COLUMNS)
     except FileNotFoundError:
         st.error(f"Error: 파일을 찾을 수 없습니다: {file_path}")
         return pd.DataFrame()
         
-    # Attrition을 0/1로 변환
-    df['Attrition_Numeric'] = df['Attrition'].apply(lambda x: 1 if x == 'Yes' else 0)
+    # 문자열 컬럼을 category로 변환 (groupby/isin이 작은 정수 코드로 동작)
+    for col in ['Attrition', 'Department', 'JobRole', 'Gender', 'MaritalStatus',
+                'OverTime', 'BusinessTravel', 'EducationField']:
+        df[col] = df[col].astype('category')
+
+    # 숫자 컬럼 다운캐스트 (int64/float64 -> 가능한 가장 작은 타입)
+    for col in df.select_dtypes(include=np.integer).columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include=np.floating).columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+
+    # Attrition을 0/1로 변환 ('Yes' 코드와의 벡터 비교, 카테고리 순서에 의존하지 않음)
+    attrition_cat = df['Attrition'].cat
+    df['Attrition_Numeric'] = (attrition_cat.codes == attrition_cat.categories.get_loc('Yes')).astype(np.int8)
     
     # 연령 그룹화
     bins_age = [18, 30, 40, 50, 60]
     labels_age = ['20s', '30s', '40s', '50s+']
-    df['Age_Group'] = pd.cut(df['Age'], bins=bins_age, labels=labels_age, right=False)
+    df['Age_Group'] = bin_right_open(df['Age'], bins_age, labels_age)
     
     # 근속 년수 그룹화
     bins_years = [-1, 2, 5, 10, df['YearsAtCompany'].max() + 1]
     labels_years = ['0-2 Years', '3-5 Years', '6-10 Years', '11+ Years']
-    df['YearsAtCompany_Group'] = pd.cut(df['YearsAtCompany'], bins=bins_years, labels=labels_years, right=False)
-    
+    df['YearsAtCompany_Group'] = bin_right_open(df['YearsAtCompany'], bins_years, labels_years)
+
     return df
 
 def calculate_attrition_rate(df):
     """필터링된 데이터프레임의 이직률(%) 계산 (DataFrame 입력용)"""
-    if df.empty or len(df) == 0:
+    if df.empty:
         return 0.0
-    attrition_rate = (df['Attrition_Numeric'].sum() / len(df)) * 100
+    attrition = df['Attrition_Numeric'].to_numpy()
+    attrition_rate = attrition.sum() * (100.0 / attrition.size)
     return attrition_rate
 
-def create_rate_bar_chart(df, column, title):
-    """특정 컬럼별 이직률 바 차트 생성"""
+def summarize_attrition(df, columns):
+    """여러 컬럼의 그룹별 직원 수, 이직자 수, 이직률(%) 집계 ({컬럼: 집계표} 반환)
+
+    컬럼마다 정수 그룹 코드에 대해 np.bincount로 건수/합계를 한 번에 계산한다.
+    (문자열 해싱이나 pandas groupby 디스패치 없이 C 루프 한 번)
+    """
+    attrition = df['Attrition_Numeric'].to_numpy()
+    summaries = {}
+    for column in columns:
+        codes, groups = pd.factorize(df[column], sort=True)
+        valid = codes >= 0
+        total = np.bincount(codes[valid], minlength=len(groups))
+        attrition_count = np.bincount(codes[valid], weights=attrition[valid], minlength=len(groups)).astype(np.int64)
+        summaries[column] = pd.DataFrame({
+            column: groups,
+            'total': total,
+            'attrition_count': attrition_count,
+            'Attrition Rate (%)': attrition_count / total * 100
+        })
+    return summaries
+
+def summarize_attrition_pair(df, group_columns):
+    """두 컬럼 조합별 직원 수, 이직자 수, 이직률(%) 집계 (히트맵 입력용)
+
+    두 컬럼의 그룹 코드를 하나의 조합 코드(a * n_b + b)로 합쳐 np.bincount 한 번으로 집계하고,
+    실제로 존재하는 조합만 남긴다. (groupby(observed=True)와 같은 결과)
+    """
+    col_a, col_b = group_columns
+    codes_a, groups_a = pd.factorize(df[col_a], sort=True)
+    codes_b, groups_b = pd.factorize(df[col_b], sort=True)
+    valid = (codes_a >= 0) & (codes_b >= 0)
+
+    n_b = len(groups_b)
+    n_pairs = len(groups_a) * n_b
+    pair_codes = codes_a[valid] * n_b + codes_b[valid]
+    attrition = df['Attrition_Numeric'].to_numpy()[valid]
+    total = np.bincount(pair_codes, minlength=n_pairs)
+    attrition_count = np.bincount(pair_codes, weights=attrition, minlength=n_pairs).astype(np.int64)
+
+    observed = np.flatnonzero(total)
+    rate_table = pd.DataFrame({
+        col_a: groups_a.take(observed // n_b),
+        col_b: groups_b.take(observed % n_b),
+        'total': total[observed],
+        'attrition_count': attrition_count[observed]
+    })
+    rate_table['Attrition_Rate'] = (rate_table['attrition_count'] / rate_table['total']) * 100
+    return rate_table
+
+def sample_for_scatter(df, n=2000, strat='Attrition'):
+    """산점도용 표본 추출 (n행 이하이면 그대로, 초과 시 strat 그룹 비율을 유지하며 약 n행으로 축소)"""
+    if len(df) <= n:
+        return df
+    return df.groupby(strat, observed=True, group_keys=False).sample(frac=n / len(df), random_state=0)
+
+def show_summary_only(df):
+    """행 수가 MIN_CHART_ROWS 미만일 때 차트 대신 안내 문구와 요약 통계만 표시 (통계적 의미가 없는 Figure 생성을 생략)"""
     if df.empty:
+        st.warning("필터링된 데이터가 없습니다.")
+        return
+    st.info(f"필터 조건에 해당하는 데이터가 {len(df)}건뿐이라 ({MIN_CHART_ROWS}건 미만) 차트 대신 요약 통계만 표시합니다.")
+    st.dataframe(df.describe())
+
+# 아래 Figure 생성 함수들은 st.cache_resource로 감싸, 입력 집계표 내용(해시)이 같으면 Figure를 다시 만들지 않음
+# (반환된 Figure는 세션 간 공유되므로 호출한 쪽에서 수정하지 않음)
+# 필터 조합마다 키가 달라지므로 max_entries로 보관 개수를 제한 (오래 실행되는 서버에서 Figure가 무한히 쌓이지 않도록)
+
+@st.cache_resource(max_entries=64)
+def create_rate_heatmap(rate_table, x, y, title, color_scale, x_title=None, y_title=None, colorbar_title=None):
+    """summarize_attrition_pair 결과를 (y x x) 이직률 행렬로 바꿔 히트맵 생성 (Plotly가 다시 집계하지 않도록 셀 값만 전달)"""
+    matrix = rate_table.pivot(index=y, columns=x, values='Attrition_Rate')
+    fig = px.imshow(
+        matrix,
+        text_auto='.1f',
+        color_continuous_scale=color_scale,
+        aspect='auto',
+        origin='lower',
+        title=title
+    )
+    fig.update_layout(xaxis_title=x_title or x, yaxis_title=y_title or y)
+    if colorbar_title:
+        fig.update_layout(coloraxis_colorbar_title=colorbar_title)
+    return fig
+
+@st.cache_resource(max_entries=64)
+def create_attrition_pie(attrition_counts):
+    """이직 여부별 인원 집계표로 이직자/잔류자 비율 파이 차트 생성"""
+    return px.pie(
+        attrition_counts,
+        names='Attrition',
+        values='count',
+        title='<b>전체 이직자(Yes)/잔류자(No) 비율</b>',
+        color_discrete_sequence=px.colors.sequential.RdBu
+    )
+
+@st.cache_resource(max_entries=64)
+def create_treemap(df_treemap):
+    """JobLevel -> JobSatisfaction 조합별 직원 수(크기)와 이직률(색상) 트리맵 생성"""
+    return px.treemap(
+        df_treemap,
+        path=['JobLevel', 'JobSatisfaction'],
+        values='total',
+        color='attrition_rate',
+        color_continuous_scale='Reds', # 이직률이 높을수록 빨갛게
+        title='<b>직무 등급(JobLevel) 및 만족도별 직원 수 (색상: 이직률)</b>'
+    )
+
+def create_rate_bar_chart(attrition_summary, column, title):
+    """특정 컬럼별 이직률 바 차트 생성 (summarize_attrition 결과 입력용)"""
+    if attrition_summary.empty:
         return None
-        
-    attrition_summary = df.groupby(column, observed=False)['Attrition_Numeric'].agg(
-        total='count',
-        attrition_count='sum'
-    ).reset_index()
-    attrition_summary['Attrition Rate (%)'] = (attrition_summary['attrition_count'] / attrition_summary['total']) * 100
+    return go.Figure(build_rate_bar_figure(attrition_summary, column, title))
 
+@st.cache_data(max_entries=64)
+def build_rate_bar_figure(attrition_summary, column, title):
+    """이직률 바 차트를 생성하여 dict로 반환 (같은 집계표/제목이면 캐시된 결과 재사용)"""
+    # 이직률 내림차순 정렬 (작은 집계표이므로 numpy argsort 한 번으로 처리)
+    order = np.argsort(-attrition_summary['Attrition Rate (%)'].to_numpy(), kind='stable')
     fig = px.bar(
-        attrition_summary.sort_values(by='Attrition Rate (%)', ascending=False),
+        attrition_summary.iloc[order],
         x=column,
         y='Attrition Rate (%)',
         color='Attrition Rate (%)',
@@ -62,8 +209,49 @@ def create_rate_bar_chart(df, column, title):
     )
     fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
     fig.update_layout(xaxis_title=column, yaxis_title="Attrition Rate (%)", uniformtext_minsize=8, uniformtext_mode='hide')
+    return fig.to_dict()
+
+@st.cache_resource(max_entries=64)
+def create_rate_bar_grid(summaries, columns, start_no=1):
+    """여러 컬럼의 이직률 바 차트를 2열 subplot Figure 하나로 생성 (차트 10개를 개별 렌더링하지 않기 위함)"""
+    n_rows = (len(columns) + 1) // 2
+    fig = make_subplots(
+        rows=n_rows,
+        cols=2,
+        subplot_titles=[f'<b>{start_no + i}. {column}별 이직률</b>' for i, column in enumerate(columns)],
+        vertical_spacing=0.06
+    )
+    for i, column in enumerate(columns):
+        summary = summaries[column]
+        rates = summary['Attrition Rate (%)'].to_numpy()
+        order = np.argsort(-rates, kind='stable')
+        fig.add_trace(
+            go.Bar(
+                x=summary[column].to_numpy()[order].tolist(),
+                y=rates[order],
+                text=rates[order],
+                texttemplate='%{text:.1f}%',
+                textposition='outside',
+                marker=dict(color=rates[order], colorscale='Reds', cmin=0, cmax=max(rates.max(), 1) if rates.size else 1),
+                name=column
+            ),
+            row=i // 2 + 1,
+            col=i % 2 + 1
+        )
+    fig.update_yaxes(title_text="Attrition Rate (%)")
+    fig.update_layout(height=350 * n_rows, showlegend=False, uniformtext_minsize=8, uniformtext_mode='hide')
     return fig
 
+@st.cache_resource
+def get_sidebar_meta():
+    """사이드바 옵션(부서 목록, 연령 범위, 부서별 직무 목록)을 한 번만 계산 (매 실행마다 unique/min/max를 반복하지 않기 위함)"""
+    return {
+        'departments': df['Department'].unique().tolist(),
+        'age_min': int(df['Age'].min()),
+        'age_max': int(df['Age'].max()),
+        'roles_by_department': df.groupby('Department', observed=True)['JobRole'].unique().apply(list).to_dict(),
+    }
+
 # 데이터 로드 (파일 경로는 사용자가 마지막에 제시한 경로를 따름)
 df = load_data('HR-Employee-Attrition.csv')
 
@@ -76,15 +264,17 @@ if df.empty:
 st.set_page_config(layout="wide")
 st.sidebar.title("sales 이직률 감소를 위한 분석 대시보드")
 
-# 필터 옵션
-all_departments = df['Department'].unique().tolist()
+# 필터 옵션 (캐시된 메타 정보에서 조회)
+sidebar_meta = get_sidebar_meta()
+all_departments = sidebar_meta['departments']
 selected_departments = st.sidebar.multiselect(
     "부서 (Department)",
     options=all_departments,
     default=all_departments
 )
 
-all_job_roles = df[df['Department'].isin(selected_departments)]['JobRole'].unique().tolist()
+roles_by_department = sidebar_meta['roles_by_department']
+all_job_roles = sorted({role for dept in selected_departments for role in roles_by_department[dept]})
 selected_job_roles = st.sidebar.multiselect(
     "직무 (JobRole)",
     options=all_job_roles,
@@ -97,7 +287,7 @@ selected_gender = st.sidebar.radio(
     index=0
 )
 
-min_age, max_age = int(df['Age'].min()), int(df['Age'].max())
+min_age, max_age = sidebar_meta['age_min'], sidebar_meta['age_max']
 selected_age_range = st.sidebar.slider(
     "연령대 (Age Range)",
     min_value=min_age,
@@ -106,14 +296,68 @@ selected_age_range = st.sidebar.slider(
 )
 
 # 데이터 필터링 적용 (전역 필터)
-filtered_df = df[
-    (df['Department'].isin(selected_departments)) &
-    (df['JobRole'].isin(selected_job_roles)) &
-    (df['Age'] >= selected_age_range[0]) &
-    (df['Age'] <= selected_age_range[1])
-]
-if selected_gender != 'All':
-    filtered_df = filtered_df[filtered_df['Gender'] == selected_gender]
+@st.cache_data(max_entries=64)
+def get_filtered_index(departments, job_roles, gender, age_min, age_max):
+    """사이드바 필터 조건에 해당하는 행 위치(정수 인덱스 배열) 계산 (같은 필터 조합은 캐시된 결과 반환)"""
+    # 선택 값을 category 코드로 바꿔 정수 배열끼리 비교 (문자열 해싱 없음)
+    dept_cat = df['Department'].cat
+    role_cat = df['JobRole'].cat
+    dept_codes = np.array([dept_cat.categories.get_loc(d) for d in departments], dtype=dept_cat.codes.dtype)
+    role_codes = np.array([role_cat.categories.get_loc(r) for r in job_roles], dtype=role_cat.codes.dtype)
+
+    # 조건별 bool 배열을 하나의 마스크에 제자리(&=)로 누적하여 중간 배열 생성을 줄임
+    age = df['Age'].to_numpy()
+    mask = np.isin(dept_cat.codes.to_numpy(), dept_codes)
+    mask &= np.isin(role_cat.codes.to_numpy(), role_codes)
+    mask &= age >= age_min
+    mask &= age <= age_max
+    if gender != 'All':
+        gender_cat = df['Gender'].cat
+        mask &= gender_cat.codes.to_numpy() == gender_cat.categories.get_loc(gender)
+    return np.flatnonzero(mask)
+
+def get_filtered_data(departments, job_roles, gender, age_min, age_max):
+    """사이드바 필터 조건으로 데이터 필터링 (행 위치는 get_filtered_index 캐시를 사용하고, DataFrame 사본은 캐시하지 않음)"""
+    return df.take(get_filtered_index(departments, job_roles, gender, age_min, age_max))
+
+@st.cache_data(max_entries=64)
+def get_department_data(filter_key, department):
+    """필터링된 데이터 중 특정 부서의 데이터만 추출 (같은 필터 조건이면 다시 계산하지 않음)"""
+    data = get_filtered_data(*filter_key)
+    return data[data['Department'] == department]
+
+@st.cache_data(max_entries=64)
+def attrition_summaries(filter_key, columns):
+    """필터 조건별 여러 컬럼의 이직률 집계 (같은 조건이면 groupby를 다시 하지 않음)"""
+    return summarize_attrition(get_filtered_data(*filter_key), columns)
+
+@st.cache_data(max_entries=64)
+def attrition_rate_table(filter_key, group_columns):
+    """필터 조건별 두 컬럼 조합의 이직률(%) 집계 (히트맵 입력용, 같은 조건이면 캐시된 결과 반환)"""
+    return summarize_attrition_pair(get_filtered_data(*filter_key), group_columns)
+
+@st.cache_data(max_entries=64)
+def sales_aggregates(filter_key):
+    """Sales팀 탭에서 사용하는 집계표를 한 번에 계산 ({요인 또는 히트맵 이름: 집계표})"""
+    df_sales = get_department_data(filter_key, 'Sales')
+    tables = summarize_attrition(df_sales, SALES_FACTORS)
+    tables['yac_ot'] = summarize_attrition_pair(df_sales, ('YearsAtCompany_Group', 'OverTime'))
+    tables['bt_wlb'] = summarize_attrition_pair(df_sales, ('BusinessTravel', 'WorkLifeBalance'))
+    tables['es_js'] = summarize_attrition_pair(df_sales, ('EnvironmentSatisfaction', 'JobSatisfaction'))
+    return tables
+
+filter_key = (
+    tuple(selected_departments),
+    tuple(selected_job_roles),
+    selected_gender,
+    selected_age_range[0],
+    selected_age_range[1]
+)
+filtered_idx = get_filtered_index(*filter_key)
+filtered_df = get_filtered_data(*filter_key)
+n_filtered = filtered_idx.size
+filtered_empty = n_filtered == 0
+too_few_rows = n_filtered < MIN_CHART_ROWS
 
 
 # --- 3. 메인 화면 - 탭 구조 ---
@@ -127,10 +371,11 @@ with tab1:
     
     col1, col2, col3, col4 = st.columns(4)
     
-    total_employees = len(filtered_df)
+    total_employees = n_filtered
     total_attrition_rate = calculate_attrition_rate(filtered_df)
-    avg_job_satisfaction = filtered_df['JobSatisfaction'].mean() if not filtered_df.empty else 0
-    avg_monthly_income = filtered_df['MonthlyIncome'].mean() if not filtered_df.empty else 0
+    # 전체 컬럼 배열에서 필터 위치만 바로 읽어 평균 계산 (pandas 디스패치 생략)
+    avg_job_satisfaction = df['JobSatisfaction'].to_numpy()[filtered_idx].mean() if not filtered_empty else 0
+    avg_monthly_income = df['MonthlyIncome'].to_numpy()[filtered_idx].mean() if not filtered_empty else 0
     
     col1.metric("총 직원 수", f"{total_employees:,}")
     col2.metric("전체 이직률 (%)", f"{total_attrition_rate:.2f}%")
@@ -145,20 +390,17 @@ with tab1:
     
     with col_l:
         st.subheader("이직자/잔류자 비율")
-        if not filtered_df.empty:
-            fig_pie = px.pie(
-                filtered_df, 
-                names='Attrition', 
-                title='<b>전체 이직자(Yes)/잔류자(No) 비율</b>',
-                color_discrete_sequence=px.colors.sequential.RdBu
-            )
+        if not filtered_empty:
+            # 원본 행 대신 category 코드 기반 value_counts 결과(2행)만 전달
+            attrition_counts = filtered_df['Attrition'].value_counts(sort=False).reset_index()
+            fig_pie = create_attrition_pie(attrition_counts)
             st.plotly_chart(fig_pie, use_container_width=True)
         else:
             st.warning("필터링된 데이터가 없습니다.")
 
     with col_r:
         st.subheader("부서별 이직률")
-        fig_dept_rate = create_rate_bar_chart(filtered_df, 'Department', '부서별 이직률')
+        fig_dept_rate = create_rate_bar_chart(attrition_summaries(filter_key, ('Department',))['Department'], 'Department', '부서별 이직률')
         if fig_dept_rate:
             st.plotly_chart(fig_dept_rate, use_container_width=True)
         else:
@@ -167,12 +409,13 @@ with tab1:
 # --- Tab 2: 상세 이직률 분석 (Detailed Attrition Rate Analysis) - 복합 차트 강화 ---
 with tab2:
     st.header("인구통계 및 직무 복합 분석")
+    if too_few_rows:
+        show_summary_only(filtered_df)
+    else:
+        col_a, col_b = st.columns(2)
     
-    col_a, col_b = st.columns(2)
-    
-    with col_a:
-        st.subheader("연봉-근속년수-직무만족도 복합 분석")
-        if not filtered_df.empty:
+        with col_a:
+            st.subheader("연봉-근속년수-직무만족도 복합 분석")
             # 3가지 요소 복합: MonthlyIncome(Y), YearsAtCompany(X), JobSatisfaction(Color), Attrition(Symbol)
             
             # --- 수정된 부분: Attrition 기호 변경 ---
@@ -180,7 +423,7 @@ with tab2:
             # ------------------------------------
             
             fig_scatter = px.scatter(
-                filtered_df,
+                sample_for_scatter(filtered_df),
                 x='YearsAtCompany',
                 y='MonthlyIncome',
                 color='JobSatisfaction',  # 색상: 직무 만족도 (연속형)
@@ -193,68 +436,49 @@ with tab2:
             fig_scatter.update_layout(height=500)
             st.plotly_chart(fig_scatter, use_container_width=True)
             st.caption("🔍 **저소득(Y축 하단), 단기 근속(X축 좌측), 낮은 직무 만족도(짙은 색상) 영역**에 'x' 기호(이직)가 집중되어 있습니다.")
-        else:
-            st.warning("필터링된 데이터가 없습니다.")
     
-    with col_b:
-        st.subheader("직무 등급 및 만족도별 이직률 (Treemap)")
-        if not filtered_df.empty:
+        with col_b:
+            st.subheader("직무 등급 및 만족도별 이직률 (Treemap)")
             # Treemap: JobLevel -> JobSatisfaction (색상: 이직률)
-            df_treemap = filtered_df.groupby(['JobLevel', 'JobSatisfaction'], observed=False)['Attrition_Numeric'].agg(
+            df_treemap = filtered_df.groupby(['JobLevel', 'JobSatisfaction'], observed=True)['Attrition_Numeric'].agg(
                 total='count',
-                attrition_rate=lambda s: (s.sum() / len(s)) * 100 if len(s) > 0 else 0 
+                attrition_count='sum'
             ).reset_index()
+            df_treemap['attrition_rate'] = (df_treemap['attrition_count'] / df_treemap['total']) * 100
             
-            fig_treemap = px.treemap(
-                df_treemap,
-                path=['JobLevel', 'JobSatisfaction'],
-                values='total',
-                color='attrition_rate',
-                color_continuous_scale='Reds', # 이직률이 높을수록 빨갛게
-                title='<b>직무 등급(JobLevel) 및 만족도별 직원 수 (색상: 이직률)</b>'
-            )
+            fig_treemap = create_treemap(df_treemap)
             st.plotly_chart(fig_treemap, use_container_width=True)
             st.caption("JobLevel 1이면서 JobSatisfaction이 1인 영역에서 이직률(색상)이 가장 높게 나타납니다.")
-        else:
-            st.warning("필터링된 데이터가 없습니다.")
 
 
 # --- Tab 3: 이직 핵심 요인 분석 (Key Driver Analysis) - 히트맵 강화 ---
 with tab3:
     st.header("주요 이직 유발 요인 상호작용 분석")
-    
-    # 1. 초과 근무 & 직무 만족도 히트맵
-    st.subheader("초과 근무(OverTime)와 직무 만족도(JobSatisfaction)의 이직률 히트맵")
-    if not filtered_df.empty:
+    if too_few_rows:
+        show_summary_only(filtered_df)
+    else:
+        # 1. 초과 근무 & 직무 만족도 히트맵
+        st.subheader("초과 근무(OverTime)와 직무 만족도(JobSatisfaction)의 이직률 히트맵")
         # 3가지 요소 복합: OverTime(X), JobSatisfaction(Y), Attrition Rate(Color)
         
         # 1. 그룹별 이직률 계산
-        df_heatmap = filtered_df.groupby(['OverTime', 'JobSatisfaction'], observed=False)['Attrition_Numeric'].agg(
-            Attrition_Rate=lambda s: (s.sum() / len(s)) * 100 if len(s) > 0 else 0
-        ).reset_index()
+        df_heatmap = attrition_rate_table(filter_key, ('OverTime', 'JobSatisfaction'))
         
         # 2. 히트맵 생성
-        fig_ot_js_heatmap = px.density_heatmap(
+        fig_ot_js_heatmap = create_rate_heatmap(
             df_heatmap,
             x='OverTime',
             y='JobSatisfaction',
-            z='Attrition_Rate',
-            histfunc='avg', # 실제로 Attrition_Rate 값을 색상으로 사용
-            color_continuous_scale="Viridis",
-            text_auto=True,
-            title="<b>초과 근무(OT) 및 직무 만족도(JS)에 따른 평균 이직률 (%)</b>"
+            title="<b>초과 근무(OT) 및 직무 만족도(JS)에 따른 평균 이직률 (%)</b>",
+            color_scale="Viridis"
         )
-        fig_ot_js_heatmap.update_layout(xaxis_title="OverTime", yaxis_title="JobSatisfaction")
         st.plotly_chart(fig_ot_js_heatmap, use_container_width=True)
         st.info("🚨 **초과 근무 'Yes' 그룹**은 직무 만족도와 관계없이 **전반적으로 이직률이 높습니다.** (특히 JS=1일 때 가장 위험)")
-    else:
-        st.warning("필터링된 데이터가 없습니다.")
 
-    st.markdown("---")
+        st.markdown("---")
     
-    # 2. 월 소득과 이직의 관계 (Box Plot 유지)
-    st.header("소득과 이직의 관계")
-    if not filtered_df.empty:
+        # 2. 월 소득과 이직의 관계 (Box Plot 유지)
+        st.header("소득과 이직의 관계")
         fig_income = px.box(
             filtered_df,
             x="Attrition",
@@ -265,8 +489,6 @@ with tab3:
         )
         st.plotly_chart(fig_income, use_container_width=True)
         st.caption("이직자 그룹(Yes)의 월소득 분포가 잔류자 그룹(No)보다 낮게 형성되어, 저소득층의 이직 경향이 뚜렷합니다.")
-    else:
-        st.warning("필터링된 데이터가 없습니다.")
 
 
 # --- Tab 4: 🎯 Sales팀 심층 분석 (Sales Attrition Deep Dive) - 15가지 복합 요소 ---
@@ -274,7 +496,7 @@ with tab4:
     st.title("🎯 Sales팀 이직률 심층 분석: 15가지 핵심 요인")
     
     # Sales팀 데이터만 필터링 (필터링된 데이터 기준: filtered_df 사용)
-    df_sales = filtered_df[filtered_df['Department'] == 'Sales']
+    df_sales = get_department_data(filter_key, 'Sales')
     
     if df_sales.empty:
         # Sales 부서가 필터링되었거나, 필터링된 데이터가 없는 경우
@@ -282,7 +504,12 @@ with tab4:
              st.error("사이드바에서 'Sales' 부서를 선택해야만 이 탭의 데이터가 표시됩니다.")
         else:
              st.error("현재 선택된 필터 조건(연령, 성별, 직무 등)에 해당하는 Sales 부서 데이터가 없습니다.")
+    elif len(df_sales) < MIN_CHART_ROWS:
+        show_summary_only(df_sales)
     else:
+        # Sales팀 탭의 모든 집계표 (필터 조건별로 한 번만 계산)
+        sales_tables = sales_aggregates(filter_key)
+
         # A. Sales팀 핵심 지표 및 현황
         st.header("Sales팀 핵심 성과 지표")
         
@@ -306,7 +533,7 @@ with tab4:
         # 1. JobRole별 MonthlyIncome vs Attrition (산점도 + 3개 요소)
         st.subheader("1. JobRole, MonthlyIncome, Attrition 복합 분석")
         fig_scatter_sales = px.scatter(
-            df_sales,
+            sample_for_scatter(df_sales),
             x='MonthlyIncome',
             y='JobRole',
             color='Attrition', # 이직 여부
@@ -319,38 +546,28 @@ with tab4:
 
         # 2. 근속년수(YAC) vs 초과근무(OT) vs 이직률 (히트맵 + 3개 요소)
         st.subheader("2. 근속년수(YAC)와 초과근무(OT)에 따른 이직률 히트맵")
-        df_yac_ot = df_sales.groupby(['YearsAtCompany_Group', 'OverTime'], observed=False)['Attrition_Numeric'].agg(
-            Attrition_Rate=lambda s: (s.sum() / len(s)) * 100 if len(s) > 0 else 0
-        ).reset_index()
+        df_yac_ot = sales_tables['yac_ot']
         
-        fig_yac_ot_heatmap = px.density_heatmap(
+        fig_yac_ot_heatmap = create_rate_heatmap(
             df_yac_ot,
             x='YearsAtCompany_Group',
             y='OverTime',
-            z='Attrition_Rate',
-            histfunc='avg',
-            color_continuous_scale="Reds",
-            text_auto=True,
-            title="<b>Sales팀 근속년수 그룹(YAC) 및 OverTime별 평균 이직률 (%)</b>"
+            title="<b>Sales팀 근속년수 그룹(YAC) 및 OverTime별 평균 이직률 (%)</b>",
+            color_scale="Reds"
         )
         st.plotly_chart(fig_yac_ot_heatmap, use_container_width=True)
         st.info("🚨 **0-2 Years & OverTime=Yes** 그룹이 가장 높은 이직률을 보입니다.")
 
         # 3. BusinessTravel vs WorkLifeBalance (WLB) vs 이직률 (히트맵 + 3개 요소)
         st.subheader("3. 출장 빈도(BT)와 WorkLifeBalance(WLB)에 따른 이직률 히트맵")
-        df_bt_wlb = df_sales.groupby(['BusinessTravel', 'WorkLifeBalance'], observed=False)['Attrition_Numeric'].agg(
-            Attrition_Rate=lambda s: (s.sum() / len(s)) * 100 if len(s) > 0 else 0
-        ).reset_index()
+        df_bt_wlb = sales_tables['bt_wlb']
 
-        fig_bt_wlb_heatmap = px.density_heatmap(
+        fig_bt_wlb_heatmap = create_rate_heatmap(
             df_bt_wlb,
             x='BusinessTravel',
             y='WorkLifeBalance',
-            z='Attrition_Rate',
-            histfunc='avg',
-            color_continuous_scale="Cividis",
-            text_auto=True,
-            title="<b>Sales팀 BusinessTravel 및 WorkLifeBalance별 평균 이직률 (%)</b>"
+            title="<b>Sales팀 BusinessTravel 및 WorkLifeBalance별 평균 이직률 (%)</b>",
+            color_scale="Cividis"
         )
         st.plotly_chart(fig_bt_wlb_heatmap, use_container_width=True)
         st.caption("출장이 잦고 WLB 점수가 낮은 (1 또는 2) 그룹의 이직률이 높습니다.")
@@ -360,23 +577,16 @@ with tab4:
         st.subheader("4. 환경 만족도(ES) vs 직무 만족도(JS)에 따른 이직률 히트맵")
         
         if not df_sales.empty:
-            # 히트맵 생성: z축을 Attrition_Numeric(0/1)의 평균(avg)으로 설정하면 자동으로 이직률 계산됨
-            fig_es_js_heatmap = px.density_heatmap(
-                df_sales,
+            # 히트맵 생성: 만족도 조합별 이직률(%)을 미리 집계한 행렬 사용
+            fig_es_js_heatmap = create_rate_heatmap(
+                sales_tables['es_js'],
                 x='EnvironmentSatisfaction',
                 y='JobSatisfaction',
-                z='Attrition_Numeric',
-                histfunc='avg',  # 평균값을 계산하여 색상으로 표시 (이직률)
-                color_continuous_scale='RdBu_r', # 빨간색(Red)일수록 이직률 높음, 파란색(Blue)일수록 낮음
-                text_auto='.1%', # 박스 안에 % 수치 표시
-                title='<b>Sales팀 환경(ES) x 직무(JS) 만족도별 이직률 (%)</b>'
-            )
-            
-            # 레이아웃 다듬기
-            fig_es_js_heatmap.update_layout(
-                xaxis_title="환경 만족도 (Environment Satisfaction)",
-                yaxis_title="직무 만족도 (Job Satisfaction)",
-                coloraxis_colorbar_title="이직률"
+                title='<b>Sales팀 환경(ES) x 직무(JS) 만족도별 이직률 (%)</b>',
+                color_scale='RdBu_r', # 빨간색(Red)일수록 이직률 높음, 파란색(Blue)일수록 낮음
+                x_title="환경 만족도 (Environment Satisfaction)",
+                y_title="직무 만족도 (Job Satisfaction)",
+                colorbar_title="이직률"
             )
             
             st.plotly_chart(fig_es_js_heatmap, use_container_width=True)
@@ -388,7 +598,7 @@ with tab4:
         # 5. DistanceFromHome vs YearsSinceLastPromotion vs Attrition (버블 차트 + 3개 요소)
         st.subheader("5. 재택 거리(DFH)와 승진 후 년수(YSLP)에 따른 이직 현황")
         fig_dfh_yslp_bubble = px.scatter(
-            df_sales,
+            sample_for_scatter(df_sales),
             x='YearsSinceLastPromotion',
             y='DistanceFromHome',
             color='Attrition',
@@ -406,23 +616,9 @@ with tab4:
         st.markdown("---")
         st.subheader("Sales팀 상세 단일 요인 분석 (이직률 바 차트 10가지)")
 
-        factors = [
-            'OverTime', 'BusinessTravel', 'JobSatisfaction', 'YearsAtCompany_Group', 
-            'WorkLifeBalance', 'JobLevel', 'EducationField', 'RelationshipSatisfaction',
-            'PerformanceRating', 'MaritalStatus'
-        ]
-        
-        for i, factor in enumerate(factors):
-            if i % 2 == 0:
-                col_l, col_r = st.columns(2)
-                current_col = col_l
-            else:
-                current_col = col_r
-            
-            with current_col:
-                st.markdown(f"**{i+6}. {factor}별 이직률**")
-                fig = create_rate_bar_chart(df_sales, factor, f'{factor} 그룹별 이직률')
-                st.plotly_chart(fig, use_container_width=True)
+        # 10개 요인 차트를 5x2 subplot Figure 하나로 렌더링 (집계는 sales_aggregates에서 완료)
+        fig_factors = create_rate_bar_grid(sales_tables, tuple(SALES_FACTORS), start_no=6)
+        st.plotly_chart(fig_factors, use_container_width=True)
 
         
         st.markdown("---")